@@ -6,6 +6,9 @@ It provides functionality to have conversations with an AI model about
 the content of video transcripts.
 """
 
+import asyncio
+import os
+import httpx
 import ollama
 
 class Chatbot:
@@ -14,51 +17,63 @@ class Chatbot:
     
     This class provides methods to interact with Ollama AI models,
     enabling conversations about video transcript content. It includes
-    service availability checking and interactive chat functionality.
+    model prewarming, interactive chat and concurrent one-shot questions.
     
     Attributes:
         model (str): Name of the Ollama model to use for chat
+        history_turns (int): Number of past exchanges sent with each question
+        keep_alive (str): How long Ollama keeps the model loaded after a request
     """
 
-    def __init__(self, model):
+    def __init__(self, model, history_turns=8, keep_alive=None):
         """
         Initialize the Chatbot with a specific Ollama model.
         
         Args:
             model (str): Name of the Ollama model to use (e.g., 'deepseek-r1')
+            history_turns (int): Number of past question/answer exchanges kept
+                                 in the chat history, on top of the transcript;
+                                 None keeps the whole conversation (default: 8)
+            keep_alive (str): How long Ollama keeps the model in memory after
+                              each request, e.g. '30m' (default: None, the
+                              server's setting)
         """
         self.model = model
+        self.history_turns = history_turns
+        self.keep_alive = keep_alive
 
-    def check_ollama_running(self):
+    def _ollama_error(self, error):
         """
-        Check if the Ollama service is running and the model is available.
+        Turn an error raised by an Ollama request into a user-friendly one.
         
-        This method attempts to send a test message to verify both service
-        availability and model existence.
-        
-        Returns:
-            bool: True if Ollama is running and model is available, False otherwise
+        Args:
+            error (Exception): Error raised by the Ollama client
             
-        Raises:
-            Exception: If the specified model is not available in Ollama
+        Returns:
+            Exception: The exception to raise instead
         """
-        try:
-            # Check if Ollama service is running
-            response = ollama.chat(
-                model=self.model,
-                messages=[{'role': 'user', 'content': 'Hello'}]
-            )
-            
-            # Verify response format
-            if not ('message' in response and 'content' in response['message']):
-                return False
-                
-            return True
+        if isinstance(error, ollama.ResponseError) and error.status_code == 404:
+            return Exception(f"Model {self.model} is not available. Please check your config.json and make sure it matches an available Ollama model.")
+        # Streamed requests let the underlying httpx error through
+        if isinstance(error, (ConnectionError, httpx.ConnectError)):
+            return Exception('Ollama service is not running. Please start Ollama.')
+        return error
 
-        except Exception as e:
-            if "no such model" in str(e).lower():
-                raise Exception(f"Model {self.model} is not available. Please check your config.json and make sure it matches an available Ollama model.")
-            return False
+    def prewarm(self):
+        """
+        Load the model in Ollama ahead of the first chat turn.
+        
+        This is meant to run in the background while other work (download,
+        transcription, typing the first question) is in progress. A
+        generation with an empty prompt makes Ollama load the model weights
+        without generating anything, and keep_alive keeps them loaded, so
+        the first real question is answered without that delay. Failures
+        are ignored here; they are reported when the first question is sent.
+        """
+        try:
+            ollama.generate(model=self.model, prompt='', keep_alive=self.keep_alive)
+        except Exception:
+            pass
 
     def interactive_chat(self, transcript_file):
         """
@@ -72,15 +87,29 @@ class Chatbot:
             transcript_file (str): Path to the transcript file to discuss
             
         Raises:
-            Exception: If Ollama service is not running
+            Exception: If Ollama service is not running or the model is not
+                       available
         """
-        if not self.check_ollama_running():
-            raise Exception('Ollama service is not running. Please start Ollama.')
-        
         # Open and read the content of the transcript file
         with open(transcript_file, 'r') as file:
             transcript_content = file.read()
 
+        self.interactive_chat_text(transcript_content)
+
+    def interactive_chat_text(self, transcript_content):
+        """
+        Start an interactive chat session about a transcript already in memory.
+        
+        Used when the transcript was just produced in the same process, so
+        it doesn't have to be read back from disk.
+        
+        Args:
+            transcript_content (str): Full text of the transcript to discuss
+            
+        Raises:
+            Exception: If Ollama service is not running or the model is not
+                       available
+        """
         # Initialize chat history with transcript as system context
         chat_history = [{'role': 'system', 'content': transcript_content}]
         
@@ -95,14 +124,85 @@ class Chatbot:
             # Add user message to chat history
             chat_history.append({'role': 'user', 'content': user_input})
             
-            # Get AI response
-            response = ollama.chat(
-                model=self.model,
-                messages=chat_history
-            )
-            
-            ai_response = response['message']['content']
-            print("Chatbot:", ai_response)
+            # Get AI response, streamed so tokens are shown as soon as they are generated.
+            # There is no separate availability check: errors of this request are reported
+            try:
+                stream = ollama.chat(
+                    model=self.model,
+                    messages=chat_history,
+                    stream=True,
+                    keep_alive=self.keep_alive
+                )
+                
+                print("Chatbot: ", end='', flush=True)
+                chunks = []
+                for part in stream:
+                    chunk = part['message']['content']
+                    print(chunk, end='', flush=True)
+                    chunks.append(chunk)
+                print()
+            except Exception as e:
+                raise self._ollama_error(e)
+            ai_response = ''.join(chunks)
             
             # Add AI response to chat history
             chat_history.append({'role': 'assistant', 'content': ai_response})
+
+            # Keep the transcript and only the latest exchanges, so the prompt
+            # doesn't grow with every question
+            if self.history_turns is not None and len(chat_history) > 1 + 2 * self.history_turns:
+                chat_history = chat_history[:1] + chat_history[len(chat_history) - 2 * self.history_turns:]
+
+    def ask_many(self, transcript_content, prompts):
+        """
+        Ask several independent questions about a transcript concurrently.
+        
+        Each prompt is sent in its own conversation, with the transcript as
+        system context. The requests are issued together through Ollama's
+        async client, so the server can generate the answers in parallel.
+        At most OLLAMA_NUM_PARALLEL (default: 4) requests are in flight,
+        matching the number of requests the server processes at once.
+        
+        Args:
+            transcript_content (str): Full text of the transcript
+            prompts (list): Questions to ask about the transcript
+            
+        Returns:
+            list: The answers, in the same order as prompts
+            
+        Raises:
+            Exception: If Ollama service is not running or the model is not
+                       available
+        """
+        try:
+            return asyncio.run(self._ask_many(transcript_content, prompts))
+        except Exception as e:
+            raise self._ollama_error(e)
+
+    async def _ask_many(self, transcript_content, prompts):
+        """
+        Send the prompts of ask_many concurrently.
+        
+        Args:
+            transcript_content (str): Full text of the transcript
+            prompts (list): Questions to ask about the transcript
+            
+        Returns:
+            list: The answers, in the same order as prompts
+        """
+        client = ollama.AsyncClient()
+        semaphore = asyncio.Semaphore(int(os.getenv('OLLAMA_NUM_PARALLEL', '4')))
+
+        async def ask(prompt):
+            async with semaphore:
+                response = await client.chat(
+                    model=self.model,
+                    messages=[
+                        {'role': 'system', 'content': transcript_content},
+                        {'role': 'user', 'content': prompt}
+                    ],
+                    keep_alive=self.keep_alive
+                )
+            return response['message']['content']
+
+        return await asyncio.gather(*(ask(prompt) for prompt in prompts))
@@ -8,6 +8,15 @@ error cases such as missing files or parameters.
 
 import json
 
+# orjson parses bytes directly and is much faster than the stdlib parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sentinel distinguishing "no default given" from an explicit default of None
+_MISSING = object()
+
 class ConfigError(Exception):
     """Custom exception class for configuration-related errors."""
     pass
@@ -22,6 +31,7 @@ class ConfigManager:
     
     Attributes:
         config_file_path (str): Path to the JSON configuration file
+        config (dict): Parsed configuration, read on first access
     """
 
     def __init__(self, config_file_path='config.json'):
@@ -33,28 +43,50 @@ class ConfigManager:
                                   (default: 'config.json')
         """
         self.config_file_path = config_file_path
+        self.config = None
+
+    def _load_config(self):
+        """
+        Parse the configuration file, once per ConfigManager.
+        
+        Returns:
+            dict: The configuration parameters
+            
+        Raises:
+            ConfigError: If the config file is not found
+        """
+        if self.config is None:
+            try:
+                with open(self.config_file_path, 'rb') as config_file:
+                    self.config = orjson.loads(config_file.read()) if orjson else json.load(config_file)
+            except FileNotFoundError:
+                raise ConfigError(f"Config file '{self.config_file_path}' not found.")
+        return self.config
 
-    def read_config(self, parameter):
+    def read_config(self, parameter, default=_MISSING):
         """
         Read a specific parameter from the configuration file.
         
         Args:
             parameter (str): Name of the configuration parameter to read
+            default: Value returned when the parameter is absent from the
+                    configuration (optional; if omitted a missing parameter
+                    raises ConfigError)
             
         Returns:
             The value of the requested parameter
             
         Raises:
             ConfigError: If the config file is not found or the parameter
-                        doesn't exist in the configuration
+                        doesn't exist in the configuration and no default
+                        was given
         """
-        try:
-            with open(self.config_file_path, 'r') as config_file:
-                config = json.load(config_file)
-        except FileNotFoundError:
-            raise ConfigError(f"Config file '{self.config_file_path}' not found.")
+        # The file is read on the first call only, later calls use the parsed dict
+        config = self._load_config()
         
         if parameter not in config:
+            if default is not _MISSING:
+                return default
             raise ConfigError(f"Parameter '{parameter}' not found in configuration.")
         
         return config[parameter]
@@ -8,6 +8,7 @@ It maintains two main directories:
 """
 
 import os
+import shutil
 
 class DirectoryManager:
     """
@@ -39,20 +40,20 @@ class DirectoryManager:
         Create the necessary directories if they don't exist.
         Also performs cleanup of the temporary directory.
         """
-        os.makedirs(self.tmp_directory, exist_ok=True)
         os.makedirs(self.work_directory, exist_ok=True)
+        # Clearing the temporary directory also (re)creates it
         self.clear_tmp_directory()
 
     def clear_tmp_directory(self):
         """
-        Remove all files from the temporary directory.
+        Remove everything from the temporary directory.
         This helps maintain a clean workspace and prevent conflicts
         between different processing runs.
         """
-        for file in os.listdir(self.tmp_directory):
-            file_path = os.path.join(self.tmp_directory, file)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
+        # Dropping the whole tree avoids a stat and a remove call per entry,
+        # and also cleans up subdirectories left by interrupted downloads
+        shutil.rmtree(self.tmp_directory, ignore_errors=True)
+        os.makedirs(self.tmp_directory, exist_ok=True)
 
     def get_tmp_directory(self):
         """
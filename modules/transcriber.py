@@ -6,11 +6,194 @@ It provides functionality to convert speech to text and format the output with
 metadata from the source video.
 """
 
+import functools
 import json
+import mmap
 import os
 import re
-import torch
-from faster_whisper import WhisperModel
+import wave
+import ctranslate2
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+# orjson parses bytes directly and is much faster than the stdlib parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# mutagen is optional: without it, local audio without a JSON file gets default metadata
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+# Characters that are replaced by '_' in transcript file names
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9_\-]')
+
+@functools.lru_cache(maxsize=1)
+def _load_model(model_name, device, compute_type, flash_attention):
+    """
+    Load a Whisper model, reusing the one already loaded with the same settings.
+    
+    Loading reads the weights from disk and sets up the device, so every
+    Transcriber created in the same process shares a single model.
+    
+    Args:
+        model_name (str): Name of the Whisper model to load
+        device (str): Computing device to use
+        compute_type (str): Computation type for the model
+        flash_attention (bool): Whether to use FlashAttention kernels
+        
+    Returns:
+        WhisperModel: The loaded model
+    """
+    # The flash_attention keyword only exists from CTranslate2 4.3, so it is
+    # passed only when enabled and older versions keep working on CPU
+    options = {'flash_attention': True} if flash_attention else {}
+    return WhisperModel(model_name, device=device, compute_type=compute_type, **options)
+
+def _read_whisper_wav(audio_file):
+    """
+    Read a WAV file that is already in Whisper's input format.
+    
+    Whisper works on 16 kHz mono audio. Files in that format as 16-bit PCM,
+    like the ones extracted by the YouTube downloader, are read directly
+    instead of going through the generic decoder and resampler.
+    
+    Args:
+        audio_file (str): Path to the audio file
+        
+    Returns:
+        numpy.ndarray: The float32 samples, or None if the file is not a
+                       16 kHz mono 16-bit WAV file
+    """
+    if not audio_file.lower().endswith('.wav'):
+        return None
+    try:
+        with wave.open(audio_file, 'rb') as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (16000, 1, 2):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    # Same scaling as faster-whisper's decoder
+    samples = np.frombuffer(frames, dtype='<i2').astype(np.float32)
+    samples /= 32768.0
+    return samples
+
+@functools.lru_cache(maxsize=32)
+def _read_audio_tags(audio_file, mtime):
+    """
+    Read the title and artist tags of a local audio file.
+    
+    The result is cached per file and modification time, so a file that
+    is processed again in the same run isn't parsed twice.
+    
+    Args:
+        audio_file (str): Path to the audio file
+        mtime (float): Modification time of the file, part of the cache key
+        
+    Returns:
+        dict: 'title' and 'uploader' entries for the tags that were found,
+              in the same format as the yt-dlp metadata
+    """
+    if mutagen is None:
+        return {}
+    try:
+        # Easy tags give the same keys for ID3 (v1 and v2) and MP4 files
+        tags = mutagen.File(audio_file, easy=True) or {}
+    except mutagen.MutagenError:
+        return {}
+    data = {}
+    for tag, key in (('title', 'title'), ('artist', 'uploader')):
+        values = tags.get(tag)
+        if values:
+            data[key] = values[0]
+    return data
+
+def _transcript_header(title, youtube_url, author, description):
+    """
+    Build the metadata header that precedes the transcript text.
+    
+    Args:
+        title (str): Title of the video
+        youtube_url (str): URL (or input path) of the source
+        author (str): Uploader of the video
+        description (str): Description of the video
+        
+    Returns:
+        str: The header, ending with a blank line
+    """
+    return (
+        f"The following text is the transcript of a YouTube video. The video title is \"{title}\" from {youtube_url}\n"
+        f"The author is: {author}\n"
+        f"The video description is: {description}\n\n"
+        f"The following text is the transcript of the video:\n\n"
+    )
+
+def source_id(metadata, source):
+    """
+    Get the identifier of the source a transcript is made from.
+    
+    Args:
+        metadata (dict): yt-dlp metadata of the video, or the tags of a
+                         local audio file
+        source (str): URL of the video, or path of the local audio file
+        
+    Returns:
+        str: The yt-dlp video id, or the name of the local file without its
+             extension when there is no id
+    """
+    return metadata.get('id') or os.path.splitext(os.path.basename(source))[0]
+
+def transcript_path(work_directory, title, video_id):
+    """
+    Get the path of the transcript file of a video.
+    
+    The title keeps the name readable, the id keeps it unique, so videos
+    sharing a title don't share a transcript file.
+    
+    Args:
+        work_directory (str): Directory holding the transcripts
+        title (str): Title of the video
+        video_id (str): Identifier of the source, see source_id
+        
+    Returns:
+        str: Path to the transcript file
+    """
+    # Create a safe filename from the title. Each character maps to exactly one
+    # character, so truncating first gives the same name without scanning the full title
+    safe_title = _UNSAFE_FILENAME_RE.sub('_', title[:50])
+    safe_id = _UNSAFE_FILENAME_RE.sub('_', video_id)
+    return os.path.join(work_directory, f"{safe_title}_{safe_id}_transcript.txt")
+
+def find_transcript(work_directory, metadata, youtube_url):
+    """
+    Find the transcript of a video made in an earlier run.
+    
+    The transcript is looked up by the video id. It is only reused if it
+    was made from the same URL, which is recorded on its first line, so
+    local files with the same name in different directories are not
+    mixed up.
+    
+    Args:
+        work_directory (str): Directory holding the transcripts
+        metadata (dict): yt-dlp metadata of the video
+        youtube_url (str): URL of the video
+        
+    Returns:
+        str: Path to the existing transcript, or None if there is none
+    """
+    title = metadata.get('title', 'Unknown Title')
+    path = transcript_path(work_directory, title, source_id(metadata, youtube_url))
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+    except FileNotFoundError:
+        return None
+    header = _transcript_header(title, youtube_url, '', '')
+    return path if first_line == header[:header.index('\n') + 1] else None
 
 class Transcriber:
     """
@@ -24,24 +207,68 @@ class Transcriber:
         work_directory (str): Directory for storing output files
         device (str): Computing device to use (CPU/CUDA)
         compute_type (str): Computation type for the model
+        batch_size (int): Number of audio chunks decoded together, or None
+                          to decode sequentially
+        flash_attention (bool): Whether FlashAttention kernels are used (CUDA only)
+        force (bool): Whether existing transcripts are redone
+        decode_options (dict): Decoding settings passed to every transcription
+        quiet (bool): Whether progress messages are hidden
+        written_transcripts (dict): Source of each transcript file written so far
     """
 
-    def __init__(self, model_name='base', work_directory='.'):
+    def __init__(self, model_name='base', work_directory='.', batch_size=None,
+                 device='cpu', flash_attention=False, compute_type=None, force=False,
+                 decode_options=None, quiet=False):
         """
         Initialize the Transcriber with specified model and working directory.
         
         Args:
             model_name (str): Name of the Whisper model to use
             work_directory (str): Directory for storing output files
+            batch_size (int): Number of VAD-segmented audio chunks to decode
+                              in a single batch (default: None, sequential
+                              decoding)
+            device (str): Computing device, 'cpu', 'cuda' or 'auto' to use
+                          CUDA when a GPU is available (default: 'cpu',
+                          which avoids CUDA compatibility issues)
+            flash_attention (bool): Use FlashAttention 2 for the attention
+                                    layers; only applied on CUDA devices
+                                    (default: False)
+            compute_type (str): CTranslate2 computation type, e.g. 'int8' or
+                                'int8_float16' (default: None, float16 on
+                                CUDA and int8 on CPU)
+            force (bool): Transcribe again even if an up-to-date transcript
+                          already exists in the work directory (default: False)
+            decode_options (dict): Keyword arguments for faster-whisper's
+                                   transcribe, e.g. language, beam_size,
+                                   condition_on_previous_text or
+                                   without_timestamps (default: None, the
+                                   faster-whisper defaults)
+            quiet (bool): Don't print progress messages, e.g. when running in
+                          the background during a chat (default: False)
         """
         self.model_name = model_name
         self.work_directory = work_directory
-        # Force CPU usage to avoid CUDA compatibility issues
-        self.device = 'cpu'
-        self.compute_type = "int8"
-        print(f"Using device: {self.device} (forced to avoid CUDA issues)")
-        # Initialize the model in constructor
-        self.model = WhisperModel(self.model_name, device=self.device, compute_type=self.compute_type)
+        self.batch_size = batch_size
+        if device == 'auto':
+            # Ask the Whisper backend itself, so no deep learning framework is needed
+            device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+        self.device = device
+        self.force = force
+        self.decode_options = decode_options or {}
+        self.quiet = quiet
+        # Transcript files written by this Transcriber -> source they were made from
+        self.written_transcripts = {}
+        # Half precision runs on the GPU tensor cores; on CPU int8 quantization beats bfloat16
+        self.compute_type = compute_type or ("float16" if self.device == 'cuda' else "int8")
+        # CTranslate2 only provides FlashAttention kernels on GPU
+        self.flash_attention = flash_attention and self.device == 'cuda'
+        if not self.quiet:
+            print(f"Using device: {self.device}")
+        # Get the model in constructor, loading it only on first use in this process
+        self.model = _load_model(self.model_name, self.device, self.compute_type, self.flash_attention)
+        # Batched pipeline splits the audio on speech activity and decodes the chunks together
+        self.pipeline = BatchedInferencePipeline(model=self.model) if self.batch_size else None
 
     def transcribe_audio(self, audio_file):
         """
@@ -51,61 +278,177 @@ class Transcriber:
             audio_file (str): Path to the audio file to transcribe
             
         Returns:
-            str: Path to the generated transcript file
+            tuple: (path to the generated transcript file, transcript text)
         """
-        # Transcribe the audio
-        segments, _ = self.model.transcribe(audio_file)
+        # Audio already in Whisper's format is passed as samples, skipping the decoder
+        samples = _read_whisper_wav(audio_file)
+        audio = audio_file if samples is None else samples
+
+        # Transcribe the audio, batching VAD chunks when enabled
+        if self.pipeline:
+            segments, _ = self.pipeline.transcribe(audio, batch_size=self.batch_size, **self.decode_options)
+        else:
+            segments, _ = self.model.transcribe(audio, **self.decode_options)
         transcript_file = f"{audio_file}.txt"
         
-        # Combine all segments into one text
-        text = " ".join([segment.text for segment in segments])
+        # Segments are decoded lazily: write each one as soon as it is available,
+        # separated by spaces, so progress is on disk while decoding goes on.
+        # The file only gets its final name once complete, so an interrupted
+        # run never leaves a truncated transcript behind
+        partial_file = f"{transcript_file}.part"
+        texts = []
+        try:
+            with open(partial_file, "w", encoding='utf-8', newline='') as f:
+                for index, segment in enumerate(segments):
+                    if index:
+                        f.write(" ")
+                    f.write(segment.text)
+                    texts.append(segment.text)
+            os.replace(partial_file, transcript_file)
+        except BaseException:
+            # Also on Ctrl+C: don't leave the partial file next to the user's audio
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
+            raise
+        # The text is returned as well, so the caller doesn't read the file back
+        return transcript_file, " ".join(texts)
+
+    @staticmethod
+    def load_many_info(json_files):
+        """
+        Read the metadata of several videos from their yt-dlp JSON files.
         
-        # Write the transcript to a file with UTF-8 encoding
-        with open(transcript_file, "w", encoding='utf-8') as f:
-            f.write(text)
-        return transcript_file
+        Each file is memory-mapped and parsed directly from the mapping,
+        which avoids an intermediate copy of every file's content.
+        
+        Args:
+            json_files (list): Paths to the JSON files containing video metadata
+            
+        Returns:
+            list: Metadata dictionaries, in the same order as json_files
+        """
+        infos = []
+        for json_file in json_files:
+            with open(json_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson:
+                    # The view must be released before the mapping is closed
+                    with memoryview(mm) as view:
+                        infos.append(orjson.loads(view))
+                else:
+                    infos.append(json.loads(mm[:]))
+        return infos
 
-    def create_transcript_content(self, audio_file, json_file, youtube_url):
+    def create_transcript_content(self, audio_file, json_file, youtube_url, metadata=None):
         """
         Create a formatted transcript that includes video metadata.
         
         Args:
             audio_file (str): Path to the audio file
-            json_file (str): Path to the JSON file containing video metadata
+            json_file (str): Path to the JSON file containing video metadata,
+                             or None to use the tags of the audio file
             youtube_url (str): URL of the source YouTube video
+            metadata (dict): Metadata already read from json_file, e.g. by
+                             load_many_info (optional)
             
         Returns:
             str: Path to the final transcript file with metadata
         """
-        # Read metadata from JSON file
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-            title = data.get('title', 'Unknown Title')
-            author = data.get('uploader', 'Unknown Author')
-            description = data.get('description', 'No Description')
-
-        # Generate the transcript
-        transcript_file = self.transcribe_audio(audio_file)
-
-        # Read the transcript content
-        with open(transcript_file, 'r') as f:
-            transcript_content = f.read()
-
-        # Create the full content with metadata
-        full_content = (
-            f"The following text is the transcript of a YouTube video. The video title is \"{title}\" from {youtube_url}\n"
-            f"The author is: {author}\n"
-            f"The video description is: {description}\n\n"
-            f"The following text is the transcript of the video:\n\n"
-            f"{transcript_content}"
-        )
-        
-        # Create a safe filename from the title
-        safe_title = re.sub(r'[^a-zA-Z0-9_\-]', '_', title)[:50]
-        
-        # Write the full content to a new file in the work directory
-        final_transcript_file = os.path.join(self.work_directory, f"{safe_title}_transcript.txt")
-        with open(final_transcript_file, "w", encoding='utf-8') as f:
-            f.write(full_content)
+        return self.create_transcript(audio_file, json_file, youtube_url, metadata)[0]
+
+    def create_transcript(self, audio_file, json_file, youtube_url, metadata=None):
+        """
+        Create a formatted transcript and keep its text in memory.
+        
+        Same as create_transcript_content, but the text is also returned so
+        that a caller in the same process (e.g. the chat) doesn't read the
+        file back from disk.
+        
+        Args:
+            audio_file (str): Path to the audio file
+            json_file (str): Path to the JSON file containing video metadata,
+                             or None to use the tags of the audio file
+            youtube_url (str): URL of the source YouTube video
+            metadata (dict): Metadata already read from json_file (optional)
+            
+        Returns:
+            tuple: (path to the final transcript file, transcript text)
+            
+        Raises:
+            Exception: If another source already wrote the same transcript
+                       file with this Transcriber
+        """
+        # Read metadata from JSON file unless the caller already parsed it
+        data = metadata
+        if data is None and json_file:
+            with open(json_file, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson else json.load(f)
+        elif data is None:
+            # Local audio without yt-dlp metadata: fall back to its own tags
+            data = _read_audio_tags(audio_file, os.path.getmtime(audio_file))
+        title = data.get('title', 'Unknown Title')
+        author = data.get('uploader', 'Unknown Author')
+        description = data.get('description', 'No Description')
+
+        final_transcript_file = transcript_path(self.work_directory, title, source_id(data, youtube_url))
+
+        # Skip Whisper entirely if this source's transcript is already newer than the audio
+        existing_file = None if self.force else find_transcript(self.work_directory, data, youtube_url)
+        if existing_file and os.path.getmtime(existing_file) >= os.path.getmtime(audio_file):
+            if not self.quiet:
+                print(f"Reusing existing transcript: {existing_file}")
+            with open(existing_file, 'r', encoding='utf-8') as f:
+                return existing_file, f.read()
+
+        # Two sources of the same run must never share a transcript file: the
+        # second one would silently replace the first one's transcript
+        written_source = self.written_transcripts.get(final_transcript_file)
+        if written_source is not None and written_source != youtube_url:
+            raise Exception(f"{youtube_url} and {written_source} would both be saved to {final_transcript_file}. Please rename one of them.")
+
+        # Generate the transcript, its text is kept in memory
+        _, transcript_content = self.transcribe_audio(audio_file)
+
+        # Create the metadata header that precedes the transcript
+        header = _transcript_header(title, youtube_url, author, description)
+        
+        # Write the full content to a new file in the work directory,
+        # encoding once and write the whole file with a single call
+        content = header + transcript_content
+        # Written under a temporary name and renamed atomically: existing
+        # transcripts are reused by later runs, so they must never be partial
+        partial_file = f"{final_transcript_file}.part"
+        try:
+            with open(partial_file, "wb") as f:
+                f.write(content.encode('utf-8'))
+            os.replace(partial_file, final_transcript_file)
+        except BaseException:
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
+            raise
+        self.written_transcripts[final_transcript_file] = youtube_url
             
-        return final_transcript_file
+        return final_transcript_file, content
+
+    def create_transcripts_content(self, audio_files, json_files, youtube_urls):
+        """
+        Create formatted transcripts for several videos.
+        
+        The metadata files are all parsed up front with load_many_info, then
+        each audio file goes through the (batched, when enabled) Whisper
+        pipeline. The model is shared, so it is loaded only once.
+        
+        Args:
+            audio_files (list): Paths to the audio files
+            json_files (list): Paths to the matching JSON metadata files;
+                               None entries for audio read from its tags
+            youtube_urls (list): URLs (or input paths) of the sources
+            
+        Returns:
+            list: Paths to the final transcript files, in the same order as audio_files
+        """
+        infos = iter(self.load_many_info([json_file for json_file in json_files if json_file]))
+        metadata = [next(infos) if json_file else None for json_file in json_files]
+        return [
+            self.create_transcript_content(audio_file, json_file, youtube_url, metadata=info)
+            for audio_file, json_file, youtube_url, info in zip(audio_files, json_files, youtube_urls, metadata)
+        ]
@@ -8,6 +8,7 @@ The module includes error handling for missing dependencies and download failure
 
 import os
 import shutil
+from pathlib import Path
 
 try:
     import yt_dlp
@@ -26,19 +27,29 @@ class YouTubeDownloader:
     
     Attributes:
         tmp_directory (str): Directory for temporary storage of downloaded files
+        concurrent_fragments (int): Number of fragments fetched in parallel
+        use_aria2c (bool): Whether downloads go through aria2c
     """
 
-    def __init__(self, tmp_directory='tmp'):
+    def __init__(self, tmp_directory='tmp', concurrent_fragments=8, use_aria2c=True):
         """
         Initialize the YouTubeDownloader with a temporary directory.
         
         Args:
             tmp_directory (str): Path to temporary directory for downloads
+            concurrent_fragments (int): Number of fragments of a video fetched
+                                        in parallel; 1 downloads them one by
+                                        one (default: 8)
+            use_aria2c (bool): Download with aria2c and several connections
+                               per file when it is installed (default: True)
             
         Raises:
             RuntimeError: If FFmpeg is not found in system PATH
         """
         self.tmp_directory = tmp_directory
+        self.concurrent_fragments = concurrent_fragments
+        # aria2c is optional: fall back to the native downloader when it's missing
+        self.use_aria2c = bool(use_aria2c and shutil.which('aria2c'))
         os.makedirs(self.tmp_directory, exist_ok=True)
         
         # Verify FFmpeg installation
@@ -50,57 +61,170 @@ class YouTubeDownloader:
                 "3. Add the bin folder to your system's PATH environment variable"
             )
 
-    def download_audio(self, youtube_url):
+    def _ydl_options(self, outtmpl):
         """
-        Download audio from a YouTube video and extract metadata.
-        
-        This method downloads the best available audio quality from a YouTube video
-        and extracts it to MP3 format. It also saves video metadata in JSON format.
+        Build the yt-dlp options used for audio extraction.
         
         Args:
-            youtube_url (str): URL of the YouTube video to download
+            outtmpl (str): yt-dlp output template for the downloaded files
             
         Returns:
-            tuple: Paths to the (audio_file, json_file)
-            
-        Raises:
-            Exception: If download fails or URL is invalid
+            dict: Options for yt_dlp.YoutubeDL
         """
-        # Configure yt-dlp options for audio extraction
         ydl_opts = {
             'format': 'bestaudio/best',
+            # Extract straight to what Whisper works on: 16 kHz mono 16-bit PCM.
+            # The transcriber then reads the samples as they are, without
+            # decoding a compressed format or resampling
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
+                'preferredcodec': 'wav',
             }],
-            'outtmpl': f'{self.tmp_directory}/%(title)s.%(ext)s',
+            'postprocessor_args': {
+                'extractaudio': ['-ar', '16000', '-ac', '1', '-acodec', 'pcm_s16le'],
+            },
+            'outtmpl': outtmpl,
             'writeinfojson': True,
             'nocheckcertificate': True,
             'no_warnings': False,
             'quiet': False,
             # Use a modern user agent
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # Fetch the fragments of DASH/HLS formats in parallel
+            'concurrent_fragment_downloads': self.concurrent_fragments,
         }
+        if self.use_aria2c:
+            # 16 connections per file, which also speeds up non-fragmented formats
+            ydl_opts['external_downloader'] = {'default': 'aria2c'}
+            ydl_opts['external_downloader_args'] = {'aria2c': ['-x16', '-s16']}
+        return ydl_opts
+
+    def download_audio(self, youtube_url):
+        """
+        Download audio from a YouTube video and extract metadata.
+        
+        This method downloads the best available audio quality from a YouTube video
+        and extracts it to 16 kHz mono WAV, the format used by Whisper. It also
+        saves video metadata in JSON format.
+        
+        Args:
+            youtube_url (str): URL of the YouTube video to download
+            
+        Returns:
+            tuple: Paths to the (audio_file, json_file)
+            
+        Raises:
+            Exception: If download fails or URL is invalid
+        """
+        # Configure yt-dlp options for audio extraction
+        ydl_opts = self._ydl_options(f'{self.tmp_directory}/%(title)s.%(ext)s')
 
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([youtube_url])
+                audio_file, json_file = self._download(ydl, youtube_url)
         except yt_dlp.utils.DownloadError as e:
             raise Exception(f'Error downloading the video: {str(e)}. Please check if the URL is valid.')
         except Exception as e:
             raise Exception(f'Unexpected error while downloading: {str(e)}')
 
-        # Find the downloaded files
-        audio_file = None
-        json_file = None
-        for file in os.listdir(self.tmp_directory):
-            if file.endswith('.mp3'):
-                audio_file = os.path.join(self.tmp_directory, file)
-            elif file.endswith('.info.json'):
-                json_file = os.path.join(self.tmp_directory, file)
-
-        if not audio_file or not json_file:
+        if not (os.path.exists(audio_file) and os.path.exists(json_file)):
             raise Exception('Failed to locate downloaded files')
 
         return audio_file, json_file
+
+    def _download(self, ydl, youtube_url):
+        """
+        Download a video with an open yt-dlp instance.
+        
+        The file names are taken from the info dict returned by yt-dlp,
+        so no directory scan is needed to find them.
+        
+        Args:
+            ydl (yt_dlp.YoutubeDL): yt-dlp instance to download with
+            youtube_url (str): URL of the YouTube video to download
+            
+        Returns:
+            tuple: Paths to the (audio_file, json_file)
+        """
+        return self._downloaded_files(ydl, ydl.extract_info(youtube_url))
+
+    def _downloaded_files(self, ydl, info):
+        """
+        Get the paths of the files written for a downloaded video.
+        
+        Args:
+            ydl (yt_dlp.YoutubeDL): yt-dlp instance the video was downloaded with
+            info (dict): Info dict returned by yt-dlp for the download
+            
+        Returns:
+            tuple: Paths to the (audio_file, json_file)
+        """
+        # yt-dlp records the final paths, after the audio extraction, of what it wrote
+        downloads = info.get('requested_downloads') or [{}]
+        if 'filepath' in downloads[0] and 'infojson_filename' in downloads[0]:
+            return downloads[0]['filepath'], downloads[0]['infojson_filename']
+        # Otherwise, the audio extractor replaces the extension of the downloaded file
+        downloaded = Path(ydl.prepare_filename(info))
+        return str(downloaded.with_suffix('.wav')), str(downloaded.with_suffix('.info.json'))
+
+    def _id_named_options(self, quiet):
+        """
+        Build the yt-dlp options for files named after the video id.
+        
+        Args:
+            quiet (bool): Hide yt-dlp's progress output
+            
+        Returns:
+            dict: Options for yt_dlp.YoutubeDL
+        """
+        ydl_opts = self._ydl_options(f'{self.tmp_directory}/%(id)s.%(ext)s')
+        ydl_opts['quiet'] = quiet
+        ydl_opts['noprogress'] = quiet
+        return ydl_opts
+
+    def extract_video_info(self, youtube_url, quiet=False):
+        """
+        Fetch the metadata of a video without downloading it.
+        
+        The returned info dict can be passed to download_video_info to
+        download the video without fetching its metadata again.
+        
+        Args:
+            youtube_url (str): URL of the YouTube video
+            quiet (bool): Hide yt-dlp's output (default: False)
+            
+        Returns:
+            dict: The yt-dlp info dict of the video (id, title, uploader, ...)
+            
+        Raises:
+            Exception: If the URL is invalid or the video is unavailable
+        """
+        try:
+            with yt_dlp.YoutubeDL(self._id_named_options(quiet)) as ydl:
+                return ydl.extract_info(youtube_url, download=False)
+        except yt_dlp.utils.DownloadError as e:
+            raise Exception(f'Error downloading the video: {str(e)}. Please check if the URL is valid.')
+        except Exception as e:
+            raise Exception(f'Unexpected error while downloading: {str(e)}')
+
+    def download_video_info(self, info, quiet=False):
+        """
+        Download the audio and metadata of a video from its info dict.
+        
+        Args:
+            info (dict): Info dict returned by extract_video_info
+            quiet (bool): Hide yt-dlp's progress output (default: False)
+            
+        Returns:
+            tuple: Paths to the (audio_file, json_file)
+            
+        Raises:
+            Exception: If the download fails
+        """
+        try:
+            with yt_dlp.YoutubeDL(self._id_named_options(quiet)) as ydl:
+                return self._downloaded_files(ydl, ydl.process_ie_result(info, download=True))
+        except yt_dlp.utils.DownloadError as e:
+            raise Exception(f'Error downloading the video: {str(e)}. Please check if the URL is valid.')
+        except Exception as e:
+            raise Exception(f'Unexpected error while downloading: {str(e)}')
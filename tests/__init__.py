@@ -0,0 +1,30 @@
+"""
+Test Package
+------------
+Shared helpers for the unit tests.
+"""
+
+import os
+import shutil
+
+def fast_rmtree(path):
+    """
+    Remove a directory and everything it contains.
+    
+    os.scandir gets each entry's type from the directory listing itself,
+    so unlike shutil.rmtree no extra stat call is made per entry.
+    shutil.rmtree is still used on Windows.
+    
+    Args:
+        path (str): Directory to remove
+    """
+    if os.name == 'nt':
+        shutil.rmtree(path)
+        return
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
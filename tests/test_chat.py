@@ -1,11 +1,13 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import os
 import tempfile
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../modules')))
 
+import httpx
+import ollama
 from chatbot import Chatbot
 
 class TestChatbot(unittest.TestCase):
@@ -22,21 +24,21 @@ class TestChatbot(unittest.TestCase):
                 os.remove(os.path.join(self.test_dir, file))
             os.rmdir(self.test_dir)
 
-    @patch('ollama.chat')
-    def test_check_ollama_running_success(self, mock_chat):
-        mock_chat.return_value = {'message': {'content': 'Hello'}}
-        self.assertTrue(self.chatbot.check_ollama_running())
-        mock_chat.assert_called_once()
-
-    @patch('ollama.chat')
-    def test_check_ollama_running_failure_wrong_response(self, mock_chat):
-        mock_chat.return_value = {'wrong_key': 'value'}
-        self.assertFalse(self.chatbot.check_ollama_running())
+    @patch('ollama.generate')
+    def test_prewarm_ignores_errors(self, mock_generate):
+        mock_generate.side_effect = ConnectionError('Connection refused')
+        self.chatbot.prewarm()
+        mock_generate.assert_called_once()
 
     @patch('ollama.chat')
-    def test_check_ollama_running_failure_exception(self, mock_chat):
-        mock_chat.side_effect = Exception('Connection error')
-        self.assertFalse(self.chatbot.check_ollama_running())
+    @patch('ollama.generate')
+    def test_prewarm_loads_model(self, mock_generate, mock_chat):
+        chatbot = Chatbot('llama2', keep_alive='30m')
+        chatbot.prewarm()
+        
+        # An empty prompt loads the model without generating anything
+        mock_generate.assert_called_once_with(model='llama2', prompt='', keep_alive='30m')
+        mock_chat.assert_not_called()
 
     @patch('ollama.chat')
     @patch('builtins.input')
@@ -44,8 +46,7 @@ class TestChatbot(unittest.TestCase):
     def test_interactive_chat_success(self, mock_print, mock_input, mock_chat):
         # Mock ollama responses
         mock_chat.side_effect = [
-            {'message': {'content': 'Hello'}},  # For check_ollama_running
-            {'message': {'content': 'AI response'}}  # For the actual chat
+            iter([{'message': {'content': 'AI '}}, {'message': {'content': 'response'}}])  # Streamed answer
         ]
         
         # Mock user inputs: ask a question then exit
@@ -53,23 +54,76 @@ class TestChatbot(unittest.TestCase):
         
         self.chatbot.interactive_chat(self.transcript_file)
         
-        # Verify responses were printed
+        # Verify the streamed chunks were printed as they arrived
         # Note: Using args to match exactly how print is called
-        mock_print.assert_any_call('Chatbot:', 'AI response')
+        mock_print.assert_any_call('Chatbot: ', end='', flush=True)
+        mock_print.assert_any_call('AI ', end='', flush=True)
+        mock_print.assert_any_call('response', end='', flush=True)
         mock_print.assert_any_call('Chatbot: Goodbye!')
+        self.assertTrue(mock_chat.call_args.kwargs['stream'])
         
-        # Verify chat was called at least twice (check and response)
-        self.assertEqual(mock_chat.call_count, 2)
+        # No separate availability check: chat was only called for the response
+        self.assertEqual(mock_chat.call_count, 1)
+
+    @patch('ollama.generate')
+    @patch('ollama.chat')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_interactive_chat_after_prewarm(self, mock_print, mock_input, mock_chat, mock_generate):
+        chatbot = Chatbot('llama2', keep_alive='30m')
+        mock_chat.side_effect = [
+            iter([{'message': {'content': 'AI response'}}])
+        ]
+        mock_input.side_effect = ['How are you?', 'exit']
+        
+        chatbot.prewarm()
+        chatbot.interactive_chat(self.transcript_file)
+        
+        # The model is loaded once, then the question keeps it loaded as long
+        mock_generate.assert_called_once()
+        self.assertEqual(mock_chat.call_count, 1)
+        self.assertEqual(mock_chat.call_args.kwargs['keep_alive'], '30m')
+        mock_print.assert_any_call('AI response', end='', flush=True)
 
     @patch('ollama.chat')
-    def test_interactive_chat_ollama_not_running(self, mock_chat):
-        mock_chat.return_value = {'wrong_key': 'value'}
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_interactive_chat_ollama_not_running(self, mock_print, mock_input, mock_chat):
+        mock_input.side_effect = ['How are you?', 'exit']
+        mock_chat.side_effect = ConnectionError('Connection refused')
         
         with self.assertRaises(Exception) as context:
             self.chatbot.interactive_chat(self.transcript_file)
         
         self.assertTrue('Ollama service is not running' in str(context.exception))
 
+    @patch('ollama.chat')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_interactive_chat_stream_connection_error(self, mock_print, mock_input, mock_chat):
+        def stream():
+            raise httpx.ConnectError('Connection refused')
+            yield
+        mock_input.side_effect = ['How are you?', 'exit']
+        mock_chat.return_value = stream()
+        
+        with self.assertRaises(Exception) as context:
+            self.chatbot.interactive_chat(self.transcript_file)
+        
+        self.assertIn('Ollama service is not running', str(context.exception))
+
+    @patch('ollama.chat')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_interactive_chat_model_missing(self, mock_print, mock_input, mock_chat):
+        mock_input.side_effect = ['How are you?', 'exit']
+        mock_chat.side_effect = ollama.ResponseError("model 'llama2' not found", 404)
+        
+        with self.assertRaises(Exception) as context:
+            self.chatbot.interactive_chat(self.transcript_file)
+        
+        self.assertIn('Model llama2 is not available', str(context.exception))
+
     @patch('ollama.chat')
     @patch('builtins.input')
     @patch('builtins.print')
@@ -77,20 +131,75 @@ class TestChatbot(unittest.TestCase):
         # Mock multiple exchanges before exit
         mock_input.side_effect = ['First question', 'Second question', 'exit']
         mock_chat.side_effect = [
-            {'message': {'content': 'Hello'}},  # For check_ollama_running
-            {'message': {'content': 'First response'}},
-            {'message': {'content': 'Second response'}}
+            iter([{'message': {'content': 'First response'}}]),
+            iter([{'message': {'content': 'Second response'}}])
         ]
         
         self.chatbot.interactive_chat(self.transcript_file)
         
         # Verify chat responses were printed
-        mock_print.assert_any_call('Chatbot:', 'First response')
-        mock_print.assert_any_call('Chatbot:', 'Second response')
+        mock_print.assert_any_call('First response', end='', flush=True)
+        mock_print.assert_any_call('Second response', end='', flush=True)
         mock_print.assert_any_call('Chatbot: Goodbye!')
         
-        # Verify chat was called correct number of times (check + 2 responses)
-        self.assertEqual(mock_chat.call_count, 3)
+        # Verify chat was called once per question
+        self.assertEqual(mock_chat.call_count, 2)
+        
+        # The streamed first answer is kept in the history sent with the second question
+        history = mock_chat.call_args.kwargs['messages']
+        self.assertIn({'role': 'assistant', 'content': 'First response'}, history)
+
+    @patch('ollama.chat')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_interactive_chat_text(self, mock_print, mock_input, mock_chat):
+        mock_chat.side_effect = [
+            iter([{'message': {'content': 'AI response'}}])
+        ]
+        mock_input.side_effect = ['How are you?', 'exit']
+        
+        self.chatbot.interactive_chat_text('In-memory transcript')
+        
+        # The given text is used as the system context without reading any file
+        history = mock_chat.call_args.kwargs['messages']
+        self.assertEqual(history[0], {'role': 'system', 'content': 'In-memory transcript'})
+        mock_print.assert_any_call('AI response', end='', flush=True)
+
+    @patch('ollama.chat')
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_interactive_chat_history_window(self, mock_print, mock_input, mock_chat):
+        chatbot = Chatbot(model='llama3.2', history_turns=1)
+        mock_input.side_effect = ['First question', 'Second question', 'Third question', 'exit']
+        histories = []
+        def chat(model, messages, stream, keep_alive):
+            histories.append(list(messages))
+            return iter([{'message': {'content': f'Answer {len(histories)}'}}])
+        mock_chat.side_effect = chat
+        
+        chatbot.interactive_chat_text('Transcript')
+        
+        # Only the transcript and the latest exchange are sent with a new question
+        self.assertEqual(histories[-1], [
+            {'role': 'system', 'content': 'Transcript'},
+            {'role': 'user', 'content': 'Second question'},
+            {'role': 'assistant', 'content': 'Answer 2'},
+            {'role': 'user', 'content': 'Third question'},
+        ])
+
+    @patch('ollama.AsyncClient')
+    def test_ask_many(self, mock_client_class):
+        async def chat(model, messages, keep_alive):
+            return {'message': {'content': f"Answer to {messages[-1]['content']}"}}
+        mock_client_class.return_value.chat = AsyncMock(side_effect=chat)
+        
+        answers = self.chatbot.ask_many('Transcript', ['Summary?', 'Key points?'])
+        
+        # Answers follow the order of the prompts, each asked with the transcript as context
+        self.assertEqual(answers, ['Answer to Summary?', 'Answer to Key points?'])
+        self.assertEqual(mock_client_class.return_value.chat.await_count, 2)
+        for call in mock_client_class.return_value.chat.await_args_list:
+            self.assertEqual(call.kwargs['messages'][0], {'role': 'system', 'content': 'Transcript'})
 
 if __name__ == '__main__':
     unittest.main()
@@ -64,6 +64,25 @@ class TestConfigManager(unittest.TestCase):
         with self.assertRaises(ConfigError):
             self.config_manager.read_config('invalid_parameter')
 
+    def test_read_missing_config_with_default(self):
+        """
+        Test that a default value is returned for missing optional parameters.
+        Verifies that no exception is raised when a default is supplied.
+        """
+        result = self.config_manager.read_config('invalid_parameter', default=None)
+        self.assertIsNone(result)
+
+    def test_config_read_once(self):
+        """
+        Test that the configuration file is parsed only once.
+        Verifies that later reads don't open the file again.
+        """
+        self.config_manager.read_config('valid_parameter')
+        with open(self.test_config_path, 'w') as f:
+            json.dump({'valid_parameter': 'changed_value'}, f)
+        result = self.config_manager.read_config('valid_parameter')
+        self.assertEqual(result, 'expected_value')
+
     def test_file_not_found(self):
         """
         Test handling of missing configuration files.
@@ -63,9 +63,15 @@ class TestDirectoryManager(unittest.TestCase):
         with open(dummy_file, 'w') as f:
             f.write('dummy content')
 
+        # Create a dummy subdirectory as well
+        dummy_dir = os.path.join(self.tmp_dir, 'dummy')
+        os.makedirs(dummy_dir)
+
         # Clear tmp directory and check
         self.manager.clear_tmp_directory()
         self.assertFalse(os.path.exists(dummy_file))
+        self.assertFalse(os.path.exists(dummy_dir))
+        self.assertTrue(os.path.isdir(self.tmp_dir))
 
 if __name__ == '__main__':
     unittest.main()
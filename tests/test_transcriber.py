@@ -10,14 +10,24 @@ import unittest
 import os
 import sys
 import json
+import re
+import shutil
 import tempfile
+import struct
+import wave
 from unittest.mock import patch, MagicMock
-import shutil
+import numpy as np
 
 # Add the modules directory to the Python path for importing
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../modules')))
 
-from transcriber import Transcriber
+from transcriber import Transcriber, _load_model, _read_audio_tags, find_transcript, transcript_path
+from tests import fast_rmtree
+
+# Words that the real transcript of test_transcriber.mp3 must contain,
+# matched in a single pass over the text
+EXPECTED_WORDS = ['grow', 'weed', 'english', 'minute', 'quickly']
+EXPECTED_WORDS_PATTERN = re.compile(r'\b(?:' + '|'.join(map(re.escape, EXPECTED_WORDS)) + r')\b', re.IGNORECASE)
 
 class TestTranscriber(unittest.TestCase):
     """
@@ -30,30 +40,53 @@ class TestTranscriber(unittest.TestCase):
     - File handling and cleanup
     
     The tests use mocking to simulate the behavior of the
-    underlying transcription model.
+    underlying transcription model, which is never loaded.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up shared fixtures once for the whole test class.
+        The Whisper model is mocked for the whole class, so no weights
+        are ever downloaded or loaded, and a single Transcriber is shared
+        by all tests. A single temporary root directory is also shared,
+        and removed once all tests have run.
+        """
+        model_patcher = patch('transcriber.WhisperModel', side_effect=lambda *args, **kwargs: MagicMock())
+        model_patcher.start()
+        cls.addClassCleanup(model_patcher.stop)
+        # Don't let the mocked model stay in the process-wide model cache
+        _load_model.cache_clear()
+        cls.addClassCleanup(_load_model.cache_clear)
+
+        cls.work_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(fast_rmtree, cls.work_dir)
+        # Tests share the work directory, so transcripts of earlier tests are never reused
+        cls.transcriber = Transcriber(work_directory=cls.work_dir, force=True)
+        cls.audio_file = os.path.join(os.path.dirname(__file__), 'test_transcriber.mp3')
+        cls.sample_transcript = "This is a sample transcript text."
+
     def setUp(self):
         """
         Set up the test environment before each test.
-        Creates temporary directories and initializes test data.
+        Creates a subdirectory of the shared root for the files written
+        by the test.
         """
-        # Create a temporary directory for test files
-        self.test_dir = tempfile.mkdtemp()
-        self.transcriber = Transcriber(work_directory=self.test_dir)
-        self.audio_file = os.path.join(os.path.dirname(__file__), 'test_transcriber.mp3')
-        self.sample_transcript = "This is a sample transcript text."
+        # Create an isolated directory for test files
+        self.test_dir = tempfile.mkdtemp(dir=self.work_dir)
+        # Each test is its own run of the shared Transcriber
+        self.transcriber.written_transcripts.clear()
         
     def tearDown(self):
         """
         Clean up the test environment after each test.
-        Removes all temporary files and directories.
+        Removes the test's own directory; the shared root is removed
+        by the class cleanup.
         """
         # Clean up all test files
-        shutil.rmtree(self.test_dir)
+        fast_rmtree(self.test_dir)
 
-    @patch('whisper.load_model')
-    def test_transcribe_audio(self, mock_load_model):
+    def test_transcribe_audio(self):
         """
         Test the audio transcription functionality.
         
@@ -61,27 +94,152 @@ class TestTranscriber(unittest.TestCase):
         1. Mocks the Whisper model to simulate transcription
         2. Verifies the transcription process
         3. Checks the output file content
-        4. Validates model initialization parameters
-        
-        Args:
-            mock_load_model: Mock object for the Whisper model loader
+        4. Validates the model was called with the audio file
         """
-        # Mock whisper model
-        mock_model = MagicMock()
-        mock_model.to = MagicMock(return_value=mock_model)
-        mock_model.transcribe.return_value = {'text': self.sample_transcript}
-        mock_load_model.return_value = mock_model
-
-        # Test transcription
-        transcript_file = self.transcriber.transcribe_audio(self.audio_file)
+        # Mock the model transcription on the shared instance
+        segment = MagicMock(text=self.sample_transcript)
+        # The transcript is written next to the audio file, keep it out of the repository
+        audio_file = os.path.join(self.test_dir, 'audio.mp3')
+        with patch.object(self.transcriber.model, 'transcribe', return_value=([segment], None)) as mock_transcribe:
+            transcript_file, text = self.transcriber.transcribe_audio(audio_file)
         
         self.assertTrue(os.path.exists(transcript_file))
         with open(transcript_file, 'r') as f:
             content = f.read()
         self.assertEqual(content, self.sample_transcript)
+        # The text is also returned, so callers don't read the file back
+        self.assertEqual(text, self.sample_transcript)
+        
+        # Verify the model was asked to transcribe the test audio
+        mock_transcribe.assert_called_once_with(audio_file)
+
+    def test_transcribe_audio_multiple_segments(self):
+        """
+        Test that transcribed segments are joined with spaces.
+        
+        This test feeds several segments through a generator, as the
+        model does, and checks the written transcript.
+        """
+        segments = (MagicMock(text=text) for text in ['First part.', 'Second part.', 'End.'])
+        audio_file = os.path.join(self.test_dir, 'audio.mp3')
+        with patch.object(self.transcriber.model, 'transcribe', return_value=(segments, None)):
+            transcript_file, text = self.transcriber.transcribe_audio(audio_file)
+
+        with open(transcript_file, 'r') as f:
+            content = f.read()
+        self.assertEqual(content, 'First part. Second part. End.')
+        self.assertEqual(text, content)
+
+    def test_transcribe_audio_decode_options(self):
+        """
+        Test that the decoding settings are passed to the model.
+        """
+        options = {'language': 'en', 'beam_size': 1, 'without_timestamps': True}
+        transcriber = Transcriber(work_directory=self.test_dir, decode_options=options)
+        audio_file = os.path.join(self.test_dir, 'audio.mp3')
+        with patch.object(transcriber.model, 'transcribe', return_value=([], None)) as mock_transcribe:
+            transcriber.transcribe_audio(audio_file)
+
+        mock_transcribe.assert_called_once_with(audio_file, language='en', beam_size=1, without_timestamps=True)
+
+    def test_transcribe_audio_whisper_wav(self):
+        """
+        Test that 16 kHz mono WAV audio is passed to the model as samples.
+        """
+        audio_file = os.path.join(self.test_dir, 'audio.wav')
+        with wave.open(audio_file, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(struct.pack('<3h', 0, 16384, -32768))
+        segment = MagicMock(text=self.sample_transcript)
+        with patch.object(self.transcriber.model, 'transcribe', return_value=([segment], None)) as mock_transcribe:
+            self.transcriber.transcribe_audio(audio_file)
+
+        samples = mock_transcribe.call_args.args[0]
+        self.assertEqual(samples.dtype, np.float32)
+        self.assertEqual(samples.tolist(), [0.0, 0.5, -1.0])
+
+    def test_transcribe_audio_interrupted(self):
+        """
+        Test that an interrupted transcription leaves no transcript file,
+        complete or partial.
+        """
+        def segments():
+            yield MagicMock(text='First part.')
+            raise RuntimeError('Decoding failed')
+        audio_file = os.path.join(self.test_dir, 'audio.mp3')
+        with patch.object(self.transcriber.model, 'transcribe', return_value=(segments(), None)):
+            with self.assertRaises(RuntimeError):
+                self.transcriber.transcribe_audio(audio_file)
+
+        self.assertFalse(os.path.exists(f"{audio_file}.txt"))
+        self.assertFalse(os.path.exists(f"{audio_file}.txt.part"))
+
+    def test_create_transcript_write_failure(self):
+        """
+        Test that a failed transcript write leaves no partial file behind.
+        """
+        metadata = {'id': 'broken', 'title': 'Broken Write'}
+        final_file = os.path.join(self.work_dir, 'Broken_Write_broken_transcript.txt')
+        with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe, \
+             patch('transcriber.os.replace', side_effect=OSError('Disk full')):
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+            with self.assertRaises(OSError):
+                self.transcriber.create_transcript(self.audio_file, None, 'https://youtube.com/watch?v=broken', metadata=metadata)
+
+        self.assertFalse(os.path.exists(final_file))
+        self.assertFalse(os.path.exists(f"{final_file}.part"))
+
+    def test_compute_type_follows_device(self):
+        """
+        Test that the computation type matches the device.
         
-        # Verify model was loaded with correct parameters
-        mock_load_model.assert_called_once_with('base')
+        This test verifies that CUDA runs in float16 while the
+        CPU default keeps int8 quantization.
+        """
+        self.assertEqual(self.transcriber.compute_type, 'int8')
+        gpu_transcriber = Transcriber(work_directory=self.test_dir, device='cuda')
+        self.assertEqual(gpu_transcriber.compute_type, 'float16')
+        custom_transcriber = Transcriber(work_directory=self.test_dir, device='cuda', compute_type='int8_float16')
+        self.assertEqual(custom_transcriber.compute_type, 'int8_float16')
+
+    def test_auto_device(self):
+        """
+        Test that the 'auto' device uses CUDA only when a GPU is available.
+        """
+        with patch('transcriber.ctranslate2.get_cuda_device_count', return_value=1):
+            self.assertEqual(Transcriber(work_directory=self.test_dir, device='auto').device, 'cuda')
+        with patch('transcriber.ctranslate2.get_cuda_device_count', return_value=0):
+            transcriber = Transcriber(work_directory=self.test_dir, device='auto')
+        self.assertEqual(transcriber.device, 'cpu')
+        self.assertEqual(transcriber.compute_type, 'int8')
+
+    def test_model_shared_between_instances(self):
+        """
+        Test that Transcribers with the same settings share one model.
+        
+        This test verifies that the Whisper model is loaded only once
+        per process rather than once per Transcriber.
+        """
+        first_transcriber = Transcriber(work_directory=self.test_dir)
+        second_transcriber = Transcriber(work_directory=self.test_dir)
+        self.assertIs(first_transcriber.model, second_transcriber.model)
+
+    def test_flash_attention_only_passed_when_enabled(self):
+        """
+        Test that the flash_attention keyword is only given to WhisperModel when enabled.
+        
+        CTranslate2 versions before 4.3 don't accept it, so CPU runs must
+        work without it.
+        """
+        with patch('transcriber.WhisperModel') as mock_model:
+            _load_model.cache_clear()
+            Transcriber(work_directory=self.test_dir, device='cpu', flash_attention=True)
+            self.assertNotIn('flash_attention', mock_model.call_args.kwargs)
+            Transcriber(work_directory=self.test_dir, device='cuda', flash_attention=True)
+            self.assertTrue(mock_model.call_args.kwargs['flash_attention'])
+        _load_model.cache_clear()
 
     def test_create_transcript_content(self):
         """
@@ -105,9 +263,7 @@ class TestTranscriber(unittest.TestCase):
             
         # Create test audio file and transcribe
         with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
-            mock_transcribe.return_value = os.path.join(self.test_dir, 'transcript.txt')
-            with open(mock_transcribe.return_value, 'w') as f:
-                f.write(self.sample_transcript)
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
                 
             # Test transcript content creation
             youtube_url = 'https://www.youtube.com/watch?v=test'
@@ -145,9 +301,7 @@ class TestTranscriber(unittest.TestCase):
             json.dump(json_data, f)
 
         with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
-            mock_transcribe.return_value = os.path.join(self.test_dir, 'transcript.txt')
-            with open(mock_transcribe.return_value, 'w') as f:
-                f.write(self.sample_transcript)
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
 
             content_file = self.transcriber.create_transcript_content(
                 self.audio_file, json_file, 'https://youtube.com/test'
@@ -171,9 +325,7 @@ class TestTranscriber(unittest.TestCase):
             json.dump(json_data, f)
 
         with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
-            mock_transcribe.return_value = os.path.join(self.test_dir, 'transcript.txt')
-            with open(mock_transcribe.return_value, 'w') as f:
-                f.write(self.sample_transcript)
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
 
             content_file = self.transcriber.create_transcript_content(
                 self.audio_file, json_file, 'https://youtube.com/test'
@@ -187,5 +339,325 @@ class TestTranscriber(unittest.TestCase):
             self.assertIn('Unknown Author', content)
             self.assertIn('No Description', content)
 
+    def test_create_transcript_content_without_metadata(self):
+        """
+        Test transcript creation for local audio without a JSON file.
+        
+        This test verifies that default values are used when no
+        metadata file is available.
+        """
+        with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+
+            content_file = self.transcriber.create_transcript_content(
+                self.audio_file, None, self.audio_file
+            )
+
+            with open(content_file, 'r') as f:
+                content = f.read()
+
+            self.assertIn('Unknown Title', content)
+            self.assertIn(self.sample_transcript, content)
+
+    def test_create_transcript_content_with_metadata(self):
+        """
+        Test transcript creation with metadata that was already parsed.
+        
+        This test verifies that the given metadata is used and that the
+        JSON file is not read again.
+        """
+        metadata = {'title': 'Preloaded Title', 'uploader': 'Preloaded Author'}
+        json_file = os.path.join(self.test_dir, 'missing.info.json')
+
+        with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+
+            content_file = self.transcriber.create_transcript_content(
+                self.audio_file, json_file, 'https://youtube.com/test', metadata=metadata
+            )
+
+            with open(content_file, 'r') as f:
+                content = f.read()
+
+            self.assertIn('Preloaded Title', content)
+            self.assertIn('Preloaded Author', content)
+
+    def test_create_transcript_content_from_audio_tags(self):
+        """
+        Test transcript creation for local audio that has its own tags.
+        
+        This test verifies that the title and artist tags of the audio
+        file are used when there is no JSON metadata file.
+        """
+        tags = {'title': ['Tagged Title'], 'artist': ['Tagged Artist']}
+        with patch('transcriber.mutagen') as mock_mutagen, \
+             patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_mutagen.File.return_value = tags
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+            _read_audio_tags.cache_clear()
+
+            content_file = self.transcriber.create_transcript_content(
+                self.audio_file, None, self.audio_file
+            )
+            _read_audio_tags.cache_clear()
+
+        with open(content_file, 'r') as f:
+            content = f.read()
+
+        self.assertIn('Tagged Title', content)
+        self.assertIn('The author is: Tagged Artist', content)
+        mock_mutagen.File.assert_called_once_with(self.audio_file, easy=True)
+
+    def test_create_transcript_returns_text(self):
+        """
+        Test that create_transcript returns the text written to the file.
+        
+        This test verifies that the in-memory transcript matches the saved
+        file, so callers can use it without reading the file back.
+        """
+        with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+
+            content_file, text = self.transcriber.create_transcript(
+                self.audio_file, None, self.audio_file
+            )
+
+            with open(content_file, 'r') as f:
+                self.assertEqual(f.read(), text)
+            self.assertIn(self.sample_transcript, text)
+
+    def test_create_transcript_reuses_existing(self):
+        """
+        Test that an up-to-date transcript is returned without transcribing.
+        
+        This test verifies that Whisper is skipped when the transcript is
+        newer than the audio file, unless force is set.
+        """
+        transcriber = Transcriber(work_directory=self.test_dir)
+        existing_file = os.path.join(self.test_dir, 'Unknown_Title_test_transcriber_transcript.txt')
+        existing_content = (
+            f'The following text is the transcript of a YouTube video. The video title is "Unknown Title" from {self.audio_file}\n'
+            'Existing transcript'
+        )
+        with open(existing_file, 'w') as f:
+            f.write(existing_content)
+
+        with patch.object(transcriber, 'transcribe_audio') as mock_transcribe:
+            content_file, text = transcriber.create_transcript(self.audio_file, None, self.audio_file)
+
+        mock_transcribe.assert_not_called()
+        self.assertEqual(content_file, existing_file)
+        self.assertEqual(text, existing_content)
+
+        transcriber.force = True
+        with patch.object(transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+            content_file, text = transcriber.create_transcript(self.audio_file, None, self.audio_file)
+
+        mock_transcribe.assert_called_once()
+        self.assertIn(self.sample_transcript, text)
+
+    def test_create_transcript_same_title(self):
+        """
+        Test that a transcript is not reused for another source with the same title.
+        
+        This test verifies that two untagged local files, which both get the
+        'Unknown Title' title, are each transcribed to their own file.
+        """
+        transcriber = Transcriber(work_directory=self.test_dir)
+        first_audio = os.path.join(self.test_dir, 'a.mp3')
+        second_audio = os.path.join(self.test_dir, 'b.mp3')
+        for audio_file in (first_audio, second_audio):
+            shutil.copyfile(self.audio_file, audio_file)
+            # Make the audio older than the transcripts written below
+            os.utime(audio_file, (0, 0))
+
+        with patch('transcriber.mutagen', None), \
+             patch.object(transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.side_effect = [
+                (os.path.join(self.test_dir, 'a.txt'), 'Text of a'),
+                (os.path.join(self.test_dir, 'b.txt'), 'Text of b'),
+            ]
+            _read_audio_tags.cache_clear()
+            first_file, first_text = transcriber.create_transcript(first_audio, None, first_audio)
+            second_file, second_text = transcriber.create_transcript(second_audio, None, second_audio)
+            _read_audio_tags.cache_clear()
+
+        self.assertEqual(mock_transcribe.call_count, 2)
+        self.assertNotEqual(first_file, second_file)
+        self.assertTrue(first_file.endswith('Unknown_Title_a_transcript.txt'))
+        with open(first_file, 'r') as f:
+            self.assertEqual(f.read(), first_text)
+        self.assertIn('Text of a', first_text)
+        self.assertIn('Text of b', second_text)
+        self.assertIn(second_audio, second_text)
+
+    def test_create_transcripts_content_same_file_name(self):
+        """
+        Test that a transcript is never overwritten by another source of the same run.
+        
+        This test verifies that two untagged local files with the same
+        name, in different directories, don't silently share one file.
+        """
+        first_audio = os.path.join(self.test_dir, 'first', 'talk.mp3')
+        second_audio = os.path.join(self.test_dir, 'second', 'talk.mp3')
+        for audio_file in (first_audio, second_audio):
+            os.makedirs(os.path.dirname(audio_file))
+            shutil.copyfile(self.audio_file, audio_file)
+
+        with patch('transcriber.mutagen', None), \
+             patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+            _read_audio_tags.cache_clear()
+            with self.assertRaises(Exception) as context:
+                self.transcriber.create_transcripts_content(
+                    [first_audio, second_audio], [None, None], [first_audio, second_audio]
+                )
+            _read_audio_tags.cache_clear()
+
+        self.assertIn('would both be saved to', str(context.exception))
+        # The second file was refused before running Whisper on it
+        mock_transcribe.assert_called_once()
+
+    def test_quiet_transcriber(self):
+        """
+        Test that a quiet Transcriber prints nothing.
+        
+        This test verifies that neither the device nor a reused transcript
+        is reported, as it may run in the background of a chat.
+        """
+        with patch('builtins.print') as mock_print:
+            transcriber = Transcriber(work_directory=self.test_dir, quiet=True)
+            with patch.object(transcriber, 'transcribe_audio') as mock_transcribe:
+                mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+                transcriber.create_transcript(self.audio_file, None, self.audio_file)
+                transcriber.create_transcript(self.audio_file, None, self.audio_file)
+
+        # The second call reused the first transcript without saying so
+        mock_transcribe.assert_called_once()
+        mock_print.assert_not_called()
+
+    def test_find_transcript(self):
+        """
+        Test finding the transcript of a video made in an earlier run.
+        
+        This test verifies that a transcript is only found for the URL
+        it was made from.
+        """
+        transcriber = Transcriber(work_directory=self.test_dir)
+        metadata = {'title': 'Cached Video'}
+        url = 'https://youtube.com/watch?v=cached'
+        self.assertIsNone(find_transcript(self.test_dir, metadata, url))
+
+        with patch.object(transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+            content_file = transcriber.create_transcript_content(self.audio_file, None, url, metadata=metadata)
+
+        self.assertEqual(find_transcript(self.test_dir, metadata, url), content_file)
+        self.assertIsNone(find_transcript(self.test_dir, metadata, 'https://youtube.com/watch?v=other'))
+
+    def test_find_transcript_by_id(self):
+        """
+        Test that videos sharing a title keep their own transcripts.
+        
+        This test verifies that the transcript file is named after the
+        video id, so transcribing another video with the same title
+        neither hides nor overwrites the first transcript.
+        """
+        transcriber = Transcriber(work_directory=self.test_dir)
+        first = ({'id': 'first', 'title': 'Same Title'}, 'https://youtube.com/watch?v=first')
+        second = ({'id': 'second', 'title': 'Same Title'}, 'https://youtube.com/watch?v=second')
+
+        with patch.object(transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+            first_file = transcriber.create_transcript_content(self.audio_file, None, first[1], metadata=first[0])
+            second_file = transcriber.create_transcript_content(self.audio_file, None, second[1], metadata=second[0])
+
+        self.assertEqual(first_file, transcript_path(self.test_dir, 'Same Title', 'first'))
+        self.assertTrue(first_file.endswith('Same_Title_first_transcript.txt'))
+        self.assertNotEqual(first_file, second_file)
+        self.assertEqual(find_transcript(self.test_dir, first[0], first[1]), first_file)
+        self.assertEqual(find_transcript(self.test_dir, second[0], second[1]), second_file)
+
+    def test_create_transcripts_content(self):
+        """
+        Test transcript creation for several inputs at once.
+        
+        This test verifies that every input is transcribed with its own
+        metadata and that the results follow the input order.
+        """
+        json_file = os.path.join(self.test_dir, 'first.info.json')
+        with open(json_file, 'w') as f:
+            json.dump({'title': 'First Video'}, f)
+
+        with patch.object(self.transcriber, 'transcribe_audio') as mock_transcribe:
+            mock_transcribe.return_value = (os.path.join(self.test_dir, 'transcript.txt'), self.sample_transcript)
+
+            result_files = self.transcriber.create_transcripts_content(
+                [self.audio_file, self.audio_file], [json_file, None],
+                ['https://youtube.com/first', self.audio_file]
+            )
+
+        self.assertEqual(len(result_files), 2)
+        self.assertTrue(result_files[0].endswith('First_Video_first_transcript.txt'))
+        self.assertTrue(result_files[1].endswith('Unknown_Title_test_transcriber_transcript.txt'))
+
+    def test_load_many_info(self):
+        """
+        Test reading metadata from several JSON files at once.
+        
+        This test verifies that every file is parsed and that the
+        results are returned in the same order as the input paths.
+        """
+        json_files = []
+        for index in range(3):
+            json_file = os.path.join(self.test_dir, f'info{index}.json')
+            with open(json_file, 'w') as f:
+                json.dump({'title': f'Video {index}', 'uploader': 'Test Author'}, f)
+            json_files.append(json_file)
+
+        infos = Transcriber.load_many_info(json_files)
+
+        self.assertEqual([info['title'] for info in infos], ['Video 0', 'Video 1', 'Video 2'])
+        self.assertEqual(infos[0]['uploader'], 'Test Author')
+
+@unittest.skipUnless(os.environ.get('INTEGRATION'), 'set INTEGRATION=1 to run the Whisper model')
+class TestTranscriberIntegration(unittest.TestCase):
+    """
+    Integration tests for the Transcriber class.
+    
+    These tests run the real Whisper model on the sample audio file.
+    The model is downloaded on first use, so they only run when the
+    INTEGRATION environment variable is set.
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+        Copies the sample audio to a temporary directory so that the
+        transcript written next to it does not touch the tests folder.
+        """
+        self.test_dir = tempfile.mkdtemp()
+        self.audio_file = shutil.copy(
+            os.path.join(os.path.dirname(__file__), 'test_transcriber.mp3'), self.test_dir
+        )
+
+    def tearDown(self):
+        """
+        Clean up the test environment after each test.
+        Removes the temporary directory and the transcript.
+        """
+        fast_rmtree(self.test_dir)
+
+    def test_transcribe_audio_content(self):
+        """
+        Test that the real transcript contains the words spoken in the audio.
+        """
+        transcriber = Transcriber(work_directory=self.test_dir)
+        _, transcript_text = transcriber.transcribe_audio(self.audio_file)
+
+        found = {word.lower() for word in EXPECTED_WORDS_PATTERN.findall(transcript_text)}
+        self.assertEqual(found, set(EXPECTED_WORDS))
+
 if __name__ == '__main__':
     unittest.main()
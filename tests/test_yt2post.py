@@ -0,0 +1,239 @@
+"""
+Command-Line Test Module
+-----------------------
+This module contains unit tests for the yt2post command-line script.
+It verifies the handling of the inputs and the orchestration of the
+download, transcription and chat steps.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+from argparse import Namespace
+from unittest.mock import patch, MagicMock
+
+# Add the repository root to the Python path for importing the script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import yt2post
+from modules.transcriber import _transcript_header, transcript_path
+from tests import fast_rmtree
+
+class TestYt2Post(unittest.TestCase):
+    """
+    Test suite for the yt2post script.
+
+    This class tests:
+    - Input expansion (URL lists, transcripts, local audio)
+    - Input order and caching in the transcribe and full modes
+    - Error handling of the background work
+
+    The downloader, the transcriber and the chatbot are mocked, so
+    nothing is downloaded, transcribed or sent to Ollama.
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment before each test.
+        Creates a temporary work directory, a configuration reading from it
+        and mocks for the classes used by the script.
+        """
+        self.test_dir = tempfile.mkdtemp()
+        config = {
+            'tmp_directory': self.test_dir,
+            'work_directory': self.test_dir,
+            'model': 'llama3.2',
+        }
+        self.config_manager = MagicMock()
+        self.config_manager.read_config.side_effect = lambda parameter, default=None: config.get(parameter, default)
+
+        patchers = {
+            'downloader': patch('modules.youtube_downloader.YouTubeDownloader'),
+            'transcriber': patch('modules.transcriber.Transcriber'),
+            'chatbot': patch('modules.chatbot.Chatbot'),
+            'discuss': patch('yt2post.discuss'),
+        }
+        self.mocks = {name: patcher.start() for name, patcher in patchers.items()}
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+
+        self.downloader = self.mocks['downloader'].return_value
+        self.downloader.extract_video_info.side_effect = lambda url, quiet: {
+            'id': url.rsplit('=', 1)[1], 'title': 'Same Title'
+        }
+        self.downloader.download_video_info.side_effect = lambda info, quiet: (
+            f"{info['id']}.wav", f"{info['id']}.info.json"
+        )
+        self.transcriber = self.mocks['transcriber'].return_value
+        self.transcriber.create_transcript.side_effect = lambda audio_file, json_file, source: (
+            f'{audio_file}.txt', f'Transcript of {source}'
+        )
+
+    def tearDown(self):
+        """
+        Clean up the test environment after each test.
+        Removes the temporary work directory.
+        """
+        fast_rmtree(self.test_dir)
+
+    def args(self, *inputs, command='full', force=False, prompt=None):
+        """
+        Build the parsed command-line arguments for the given inputs.
+        """
+        return Namespace(command=command, force=force, prompt=prompt, url_or_input=list(inputs))
+
+    def write_file(self, name, content):
+        """
+        Write a file in the test directory and return its path.
+        """
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_expand_inputs(self):
+        """
+        Test that URL lists are replaced by their URLs, in place.
+
+        This test verifies that a .txt file of URLs is expanded while a
+        transcript and a local audio file are kept as they are.
+        """
+        url_list = self.write_file('urls.txt', 'https://youtu.be/a\n\nhttps://youtu.be/b\n')
+        transcript = self.write_file('talk_transcript.txt', 'Some transcript')
+        audio_file = os.path.join(self.test_dir, 'talk.mp3')
+
+        self.assertEqual(yt2post.read_url_list(url_list), ['https://youtu.be/a', 'https://youtu.be/b'])
+        self.assertIsNone(yt2post.read_url_list(transcript))
+        self.assertTrue(yt2post.is_transcript(transcript))
+        self.assertFalse(yt2post.is_transcript(url_list))
+        self.assertEqual(yt2post.local_audio_files(audio_file), (audio_file, None))
+        self.assertIsNone(yt2post.local_audio_files('https://youtu.be/c'))
+        self.assertEqual(
+            yt2post.expand_inputs([transcript, url_list, audio_file]),
+            [transcript, 'https://youtu.be/a', 'https://youtu.be/b', audio_file]
+        )
+
+    def test_local_audio_files_with_metadata(self):
+        """
+        Test that a yt-dlp metadata file next to local audio is used.
+        """
+        audio_file = os.path.join(self.test_dir, 'talk.mp3')
+        json_file = self.write_file('talk.info.json', '{}')
+        self.assertEqual(yt2post.local_audio_files(audio_file), (audio_file, json_file))
+
+    def test_run_full_keeps_input_order(self):
+        """
+        Test that transcripts are chatted about in input order.
+
+        This test verifies that the second video, whose download finishes
+        first, is still discussed after the first one.
+        """
+        second_downloaded = threading.Event()
+        def download_video_info(info, quiet):
+            if info['id'] == 'first':
+                second_downloaded.wait(5)
+            else:
+                second_downloaded.set()
+            return f"{info['id']}.wav", f"{info['id']}.info.json"
+        self.downloader.download_video_info.side_effect = download_video_info
+
+        urls = ['https://youtube.com/watch?v=first', 'https://youtube.com/watch?v=second']
+        yt2post.run_full(self.args(*urls), self.config_manager)
+
+        discussed = [call.args[1] for call in self.mocks['discuss'].call_args_list]
+        self.assertEqual(discussed, [f'Transcript of {url}' for url in urls])
+        # Both videos were downloaded in the background, in quiet mode
+        self.assertEqual(self.downloader.download_video_info.call_count, 2)
+        self.assertTrue(self.downloader.extract_video_info.call_args.kwargs['quiet'])
+
+    def test_run_full_transcript_input(self):
+        """
+        Test that a transcript given on the command line goes straight to the chat.
+
+        This test verifies that nothing is downloaded or transcribed and that
+        the Whisper model is not loaded.
+        """
+        transcript = self.write_file('talk_transcript.txt', 'Existing transcript')
+
+        yt2post.run_full(self.args(transcript, prompt=['Summary?']), self.config_manager)
+
+        self.mocks['discuss'].assert_called_once_with(
+            self.mocks['chatbot'].return_value, 'Existing transcript', ['Summary?']
+        )
+        self.mocks['downloader'].assert_not_called()
+        self.mocks['transcriber'].assert_not_called()
+
+    def test_run_full_cached_url(self):
+        """
+        Test that a video transcribed in an earlier run is not downloaded again.
+        """
+        url = 'https://youtube.com/watch?v=cached'
+        cached_file = transcript_path(self.test_dir, 'Same Title', 'cached')
+        with open(cached_file, 'w', encoding='utf-8') as f:
+            f.write(_transcript_header('Same Title', url, 'Author', 'Description') + 'Cached text')
+
+        yt2post.run_full(self.args(url), self.config_manager)
+
+        self.downloader.download_video_info.assert_not_called()
+        self.transcriber.create_transcript.assert_not_called()
+        self.assertIn('Cached text', self.mocks['discuss'].call_args.args[1])
+
+    @patch('builtins.print')
+    def test_run_transcribe_cached_url(self, mock_print):
+        """
+        Test that -t skips the download and the model load for a cached video.
+
+        This test verifies that only the new video is downloaded and
+        transcribed, and that --force transcribes the cached one again.
+        """
+        cached_url = 'https://youtube.com/watch?v=cached'
+        new_url = 'https://youtube.com/watch?v=new'
+        cached_file = transcript_path(self.test_dir, 'Same Title', 'cached')
+        with open(cached_file, 'w', encoding='utf-8') as f:
+            f.write(_transcript_header('Same Title', cached_url, 'Author', 'Description') + 'Cached text')
+        self.transcriber.create_transcripts_content.return_value = ['new.wav.txt']
+
+        yt2post.run_transcribe(self.args(cached_url, command='transcribe'), self.config_manager)
+
+        self.mocks['transcriber'].assert_not_called()
+        self.downloader.download_video_info.assert_not_called()
+        mock_print.assert_any_call(f"Reusing existing transcript: {cached_file}")
+
+        yt2post.run_transcribe(self.args(cached_url, new_url, command='transcribe'), self.config_manager)
+
+        self.mocks['transcriber'].assert_called_once()
+        self.transcriber.create_transcripts_content.assert_called_once_with(
+            ('new.wav',), ('new.info.json',), [new_url]
+        )
+
+        yt2post.run_transcribe(self.args(cached_url, command='transcribe', force=True), self.config_manager)
+
+        self.assertEqual(self.downloader.download_video_info.call_count, 2)
+
+    def test_run_full_failed_download(self):
+        """
+        Test that a failed download is reported without hanging.
+
+        This test verifies that the download error reaches the main thread,
+        and that no chat is started.
+        """
+        self.downloader.extract_video_info.side_effect = Exception('Error downloading the video')
+        errors = []
+        def run():
+            try:
+                yt2post.run_full(self.args('https://youtube.com/watch?v=missing'), self.config_manager)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([str(e) for e in errors], ['Error downloading the video'])
+        self.mocks['discuss'].assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
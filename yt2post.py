@@ -9,86 +9,409 @@ based on the video content. It supports three main operations:
 - Full process: Combines both operations (download, transcribe, and chat)
 
 Usage:
-    python yt2post.py [-t|--transcribe] [-c|--chat] [-f|--full] <youtube_url_or_input_file>
+    python yt2post.py [-t|--transcribe] [-c|--chat] [-f|--full] [-p <prompt> ...] [--force] <youtube_url_or_input_file> [...]
 """
 
 import argparse
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 import argcomplete
 
 from modules.config_manager import ConfigManager
 from modules.directory_manager import DirectoryManager
-from modules.youtube_downloader import YouTubeDownloader
-from modules.transcriber import Transcriber
-from modules.chatbot import Chatbot
+# The downloader, transcriber and chatbot modules pull in yt-dlp, Whisper and
+# Ollama, so they are imported only by the modes that use them
+
+# Local audio inputs are transcribed in place instead of being downloaded
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a')
+
+def read_url_list(url_or_input):
+    """
+    Read the URLs from a text file listing one YouTube URL per line.
+    
+    Args:
+        url_or_input (str): URL or path given on the command line
+        
+    Returns:
+        list: The URLs if the input is a .txt file whose non-empty lines are
+              all http(s) URLs, None otherwise
+    """
+    path = Path(url_or_input)
+    if path.suffix != '.txt' or not path.is_file():
+        return None
+    lines = [line.strip() for line in path.read_text(encoding='utf-8').splitlines() if line.strip()]
+    if lines and all(line.startswith(('http://', 'https://')) for line in lines):
+        return lines
+    return None
+
+def is_transcript(url_or_input):
+    """
+    Check whether the input is an existing transcript file.
+    
+    Args:
+        url_or_input (str): URL or path given on the command line
+        
+    Returns:
+        bool: True if the input is a .txt file (other than a list of URLs),
+              which needs no download or transcription
+    """
+    return Path(url_or_input).suffix == '.txt' and read_url_list(url_or_input) is None
+
+def local_audio_files(url_or_input):
+    """
+    Get the audio and metadata files for a local audio input.
+    
+    Args:
+        url_or_input (str): URL or path given on the command line
+        
+    Returns:
+        tuple: (audio_file, json_file) if the input is a local audio file, with
+               json_file set to None when no yt-dlp metadata sits next to it.
+               None if the input has to be downloaded.
+    """
+    path = Path(url_or_input)
+    if path.suffix not in AUDIO_EXTENSIONS:
+        return None
+    json_file = path.with_suffix('.info.json')
+    return str(path), str(json_file) if json_file.exists() else None
+
+def create_downloader(config_manager):
+    """
+    Import and initialize the YouTube downloader.
+    
+    Exits the program with a dependency error if yt-dlp or FFmpeg is missing.
+    
+    Args:
+        config_manager (ConfigManager): Configuration to read the download
+                                        settings from
+        
+    Returns:
+        YouTubeDownloader: The initialized downloader
+    """
+    try:
+        from modules.youtube_downloader import YouTubeDownloader
+        return YouTubeDownloader(
+            tmp_directory=config_manager.read_config('tmp_directory'),
+            concurrent_fragments=config_manager.read_config('concurrent_fragments', default=8),
+            use_aria2c=config_manager.read_config('use_aria2c', default=True),
+        )
+    except (ImportError, RuntimeError) as e:
+        print(f"\nDependency Error: {str(e)}")
+        sys.exit(1)
+
+def create_transcriber(args, config_manager, quiet=False):
+    """
+    Import and initialize the transcriber with the Whisper settings.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        config_manager (ConfigManager): Configuration to read the work
+                                        directory and Whisper settings from
+        quiet (bool): Hide the transcriber's progress messages (default: False)
+        
+    Returns:
+        Transcriber: The initialized transcriber
+    """
+    from modules.transcriber import Transcriber
+    return Transcriber(
+        model_name=config_manager.read_config('whisper_model', default='base'),
+        work_directory=config_manager.read_config('work_directory'),
+        batch_size=config_manager.read_config('batch_size', default=None),
+        device=config_manager.read_config('device', default='auto'),
+        flash_attention=config_manager.read_config('flash_attention', default=False),
+        compute_type=config_manager.read_config('compute_type', default=None),
+        force=args.force,
+        quiet=quiet,
+        # Greedy decoding without timestamps or previous-text conditioning is much
+        # faster, and the transcript only keeps the text
+        decode_options={
+            'language': config_manager.read_config('language', default=None),
+            'beam_size': config_manager.read_config('beam_size', default=1),
+            'condition_on_previous_text': config_manager.read_config('condition_on_previous_text', default=False),
+            'without_timestamps': config_manager.read_config('without_timestamps', default=True),
+        },
+    )
+
+def create_chatbot(config_manager):
+    """
+    Import and initialize the chatbot with the Ollama settings.
+    
+    Args:
+        config_manager (ConfigManager): Configuration to read the model and
+                                        chat settings from
+        
+    Returns:
+        Chatbot: The initialized chatbot
+    """
+    from modules.chatbot import Chatbot
+    return Chatbot(
+        model=config_manager.read_config('model'),
+        history_turns=config_manager.read_config('chat_history_turns', default=8),
+        keep_alive=config_manager.read_config('ollama_keep_alive', default='30m'),
+    )
+
+def download_workers(config_manager):
+    """
+    Read the number of videos downloaded at the same time.
+    
+    Args:
+        config_manager (ConfigManager): Configuration to read from
+        
+    Returns:
+        int: Number of download threads (default: 4)
+    """
+    return config_manager.read_config('download_workers', default=4)
+
+def expand_inputs(inputs):
+    """
+    Replace the files listing URLs by the URLs they contain.
+    
+    Args:
+        inputs (list): URLs and paths given on the command line
+        
+    Returns:
+        list: The inputs, with the content of URL lists inlined in place
+    """
+    expanded = []
+    for url_or_input in inputs:
+        expanded.extend(read_url_list(url_or_input) or [url_or_input])
+    return expanded
+
+def run_transcribe(args, config_manager):
+    """
+    Download (if needed) and transcribe videos or local audio files.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        config_manager (ConfigManager): Application configuration
+    """
+    sources = []
+    for url_or_input in expand_inputs(args.url_or_input):
+        if is_transcript(url_or_input):
+            print(f"{url_or_input} is already a transcript, nothing to transcribe.")
+        else:
+            sources.append(url_or_input)
+    if not sources:
+        return
+
+    # URLs are downloaded in parallel, local audio is used in place
+    urls = [source for source in sources if not local_audio_files(source)]
+    downloads = {}
+    if urls:
+        youtube_downloader = create_downloader(config_manager)
+        # Progress output of parallel downloads would be interleaved
+        quiet = len(urls) > 1
+        cache_dir = None if args.force else config_manager.read_config('work_directory')
+        with ThreadPoolExecutor(max_workers=download_workers(config_manager)) as download_pool:
+            downloads = dict(zip(urls, download_pool.map(
+                lambda url: download_video(youtube_downloader, url, quiet, cache_dir), urls)))
+
+    # Videos transcribed in an earlier run are neither downloaded nor transcribed again
+    cached = {url: transcript_file for url, (_, _, transcript_file) in downloads.items() if transcript_file}
+    for transcript_file in cached.values():
+        print(f"Reusing existing transcript: {transcript_file}")
+    sources = [source for source in sources if source not in cached]
+    if not sources:
+        return
+
+    transcriber = create_transcriber(args, config_manager)
+    audio_files, json_files = zip(*(local_audio_files(source) or downloads[source][:2] for source in sources))
+
+    for transcript_file in transcriber.create_transcripts_content(audio_files, json_files, sources):
+        print(f"Transcript saved to: {transcript_file}")
+
+def discuss(chatbot, transcript_content, prompts):
+    """
+    Chat about a transcript, or answer the given prompts about it.
+    
+    Args:
+        chatbot (Chatbot): Chatbot to use
+        transcript_content (str): Full text of the transcript
+        prompts (list): Prompts given on the command line; None starts an
+                        interactive chat session instead
+    """
+    if not prompts:
+        chatbot.interactive_chat_text(transcript_content)
+        return
+    # All prompts are sent at once and answered in parallel by Ollama
+    for prompt, answer in zip(prompts, chatbot.ask_many(transcript_content, prompts)):
+        print(f"\n### {prompt}\n\n{answer}")
+
+def run_chat(args, config_manager):
+    """
+    Start a chat session about each of the given transcripts in turn.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        config_manager (ConfigManager): Application configuration
+    """
+    chatbot = create_chatbot(config_manager)
+    # Load the model while the transcript is read and the first question typed
+    threading.Thread(target=chatbot.prewarm, daemon=True).start()
+    for transcript_file in args.url_or_input:
+        discuss(chatbot, Path(transcript_file).read_text(), args.prompt)
+
+def download_video(youtube_downloader, url, quiet, work_dir=None):
+    """
+    Download a single video, with files named after its id.
+    
+    The metadata is fetched first, so a video already transcribed in an
+    earlier run is not downloaded again. Naming the files after the id
+    rather than the title keeps downloads that run at the same time from
+    overwriting each other.
+    
+    Args:
+        youtube_downloader (YouTubeDownloader): Downloader to use
+        url (str): URL of the YouTube video
+        quiet (bool): Hide yt-dlp's progress output
+        work_dir (str): Work directory holding the transcripts of earlier
+                        runs, or None to always download (default: None)
+        
+    Returns:
+        tuple: Paths to the (audio_file, json_file, transcript_file); the
+               audio and JSON files are None if an existing transcript was
+               found, transcript_file is None otherwise
+    """
+    info = youtube_downloader.extract_video_info(url, quiet=quiet)
+    if work_dir:
+        from modules.transcriber import find_transcript
+        transcript_file = find_transcript(work_dir, info, url)
+        if transcript_file:
+            return None, None, transcript_file
+    audio_file, json_file = youtube_downloader.download_video_info(info, quiet=quiet)
+    return audio_file, json_file, None
+
+def transcribe_download(model_load, download, source):
+    """
+    Transcribe a video once its audio is available.
+    
+    Args:
+        model_load (Future): Future resolving to the Transcriber
+        download (Future): Future resolving to the (audio_file, json_file,
+                           transcript_file) tuple of download_video
+        source (str): URL or path the audio comes from
+        
+    Returns:
+        tuple: (path to the final transcript file, transcript text)
+    """
+    audio_file, json_file, transcript_file = download.result()
+    if transcript_file:
+        # Transcribed in an earlier run
+        return transcript_file, Path(transcript_file).read_text(encoding='utf-8')
+    return model_load.result().create_transcript(audio_file, json_file, source)
+
+def run_full(args, config_manager):
+    """
+    Download, transcribe and chat about each video in a single run.
+    
+    The work is pipelined: downloads run in parallel, transcriptions run one
+    at a time in the background, and a chat session is started for each
+    video, in input order, as soon as its transcript is ready. The next
+    videos are processed while the user is chatting about the current one.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        config_manager (ConfigManager): Application configuration
+    """
+    chatbot = create_chatbot(config_manager)
+    sources = expand_inputs(args.url_or_input)
+    # Progress output of background downloads and transcriptions would garble the chat
+    quiet = len(sources) > 1
+    cache_dir = None if args.force else config_manager.read_config('work_directory')
+
+    # One extra download worker is used to wake the Ollama model
+    download_pool = ThreadPoolExecutor(max_workers=download_workers(config_manager) + 1)
+    # Whisper already uses the whole CPU/GPU, so transcriptions run one at a time
+    transcribe_pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        download_pool.submit(chatbot.prewarm)
+        model_load = None
+        youtube_downloader = None
+        transcripts = []
+        for source in sources:
+            # An existing transcript goes straight to the chat
+            if is_transcript(source):
+                transcript = Future()
+                transcript.set_result((source, Path(source).read_text()))
+                transcripts.append(transcript)
+                continue
+
+            if model_load is None:
+                # First job of the transcription queue: load Whisper while yt-dlp downloads
+                model_load = transcribe_pool.submit(create_transcriber, args, config_manager, quiet)
+
+            local_files = local_audio_files(source)
+            if local_files:
+                download = Future()
+                download.set_result((*local_files, None))
+            else:
+                if youtube_downloader is None:
+                    youtube_downloader = create_downloader(config_manager)
+                download = download_pool.submit(download_video, youtube_downloader, source, quiet, cache_dir)
+
+            transcripts.append(transcribe_pool.submit(transcribe_download, model_load, download, source))
+
+        for transcript in transcripts:
+            # The transcript text is kept in memory, so the chat doesn't read the file back
+            _, transcript_content = transcript.result()
+            discuss(chatbot, transcript_content, args.prompt)
+    finally:
+        # Drop the jobs that haven't started yet if a step failed. Jobs already
+        # running (a download, the Whisper transcription) can't be interrupted:
+        # they finish in the background and the process only exits after them
+        download_pool.shutdown(wait=False, cancel_futures=True)
+        transcribe_pool.shutdown(wait=False, cancel_futures=True)
+
+# Command name -> (handler, name of the process used in error messages)
+COMMANDS = {
+    'transcribe': (run_transcribe, 'transcription'),
+    'chat': (run_chat, 'chat'),
+    'full': (run_full, 'full'),
+}
 
 def main():
     # Initialize argument parser with program description
     parser = argparse.ArgumentParser(description='Process YouTube videos and interact with AI.')
-    parser.add_argument('-t', '--transcribe', help='Download and transcribe the YouTube video', action='store_true')
-    parser.add_argument('-c', '--chat', help='Chat with AI based on the transcript.', action='store_true')
-    parser.add_argument('-f', '--full', help='Download, transcribe, and chat with AI.', action='store_true')
-    parser.add_argument('url_or_input', help='URL of the YouTube video or input file (mp3 or text) for processing.', nargs='?')
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument('-t', '--transcribe', help='Download and transcribe the YouTube video',
+                       dest='command', action='store_const', const='transcribe')
+    modes.add_argument('-c', '--chat', help='Chat with AI based on the transcript.',
+                       dest='command', action='store_const', const='chat')
+    modes.add_argument('-f', '--full', help='Download, transcribe, and chat with AI.',
+                       dest='command', action='store_const', const='full')
+    parser.add_argument('-p', '--prompt', action='append',
+                        help='Answer this prompt about each transcript instead of starting a chat. '
+                             'Can be repeated; the prompts are answered in parallel.')
+    parser.add_argument('--force', action='store_true',
+                        help='Transcribe again even if an up-to-date transcript already exists.')
+    parser.add_argument('url_or_input', help='URLs of the YouTube videos or input files (mp3 or text) for processing.', nargs='*')
 
     argcomplete.autocomplete(parser)
     args = parser.parse_args()
 
+    # Validate command-line arguments
+    if not (args.command and args.url_or_input):
+        parser.print_help()
+        sys.exit(1)
+
     try:
-        # Initialize configuration and required components
+        # Initialize configuration and working directories
         config_manager = ConfigManager()
         tmp_dir = config_manager.read_config('tmp_directory')
         work_dir = config_manager.read_config('work_directory')
-        model_name = config_manager.read_config('model')
-
         directory_manager = DirectoryManager(tmp_directory=tmp_dir, work_directory=work_dir)
-        
-        # Initialize YouTube downloader with error handling
-        try:
-            youtube_downloader = YouTubeDownloader(tmp_directory=tmp_dir)
-        except (ImportError, RuntimeError) as e:
-            print(f"\nDependency Error: {str(e)}")
-            sys.exit(1)
-            
-        chatbot = Chatbot(model=model_name)
-
-        # Validate command-line arguments
-        if not (args.transcribe or args.chat or args.full):
-            parser.print_help()
-            sys.exit(1) 
-        
-        # Handle transcription-only mode
-        elif args.transcribe:
-            try:
-                transcriber = Transcriber(work_directory=work_dir)
-                audio_file, json_file = youtube_downloader.download_audio(args.url_or_input)
-                transcript_file = transcriber.create_transcript_content(audio_file, json_file, args.url_or_input)
-                print(f"Transcript saved to: {transcript_file}")
-            except Exception as e:
-                print(f"\nError during transcription process: {str(e)}")
-                sys.exit(1)
-
-        # Handle chat-only mode
-        elif args.chat:
-            try:
-                chatbot.interactive_chat(args.url_or_input)
-            except Exception as e:
-                print(f"\nError during chat process: {str(e)}")
-                sys.exit(1)
-
-        # Handle full process mode (download, transcribe, and chat)
-        elif args.full:
-            try:
-                transcriber = Transcriber(work_directory=work_dir)
-                audio_file, json_file = youtube_downloader.download_audio(args.url_or_input)
-                transcript_file = transcriber.create_transcript_content(audio_file, json_file, args.url_or_input)
-                chatbot.interactive_chat(transcript_file)
-            except Exception as e:
-                print(f"\nError during full process: {str(e)}")
-                sys.exit(1)
-
     except Exception as e:
         print(f"\nAn unexpected error occurred: {str(e)}")
         sys.exit(1)
 
+    handler, process_name = COMMANDS[args.command]
+    try:
+        handler(args, config_manager)
+    except Exception as e:
+        print(f"\nError during {process_name} process: {str(e)}")
+        sys.exit(1)
+
 if __name__ == '__main__':
     main()